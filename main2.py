@@ -2,7 +2,8 @@
 VoiceKit Assistant
 - GUI: Tkinter with pulsing circle + waveform animation
 - Voice: pyttsx3 (male voice)
-- Speech recognition: SpeechRecognition (Google)
+- Speech recognition: Google Cloud streaming STT if installed, else SpeechRecognition (Google)
+- Capture: sounddevice + webrtcvad endpointing if installed, else SpeechRecognition's Microphone
 - Features: Wikipedia & Google search, AI chat (optional OpenAI), open apps by voice
 - Add custom app mappings from the GUI
 """
@@ -10,41 +11,92 @@ VoiceKit Assistant
 import os
 import sys
 import threading
+import queue
+import collections
 import time
 import webbrowser
 import subprocess
 import json
+import re
+import array
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import quote_plus
 from shutil import which
 import traceback
+import functools
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import tkinter as tk
     from tkinter import messagebox, simpledialog, filedialog
-    from PIL import Image, ImageTk
     import pyttsx3
     import speech_recognition as sr
     import wikipedia
 except Exception as e:
-    print("Missing libraries. Please install: SpeechRecognition, pyttsx3, wikipedia, Pillow, pyaudio")
+    print("Missing libraries. Please install: SpeechRecognition, pyttsx3, wikipedia, pyaudio")
     print("Error:", e)
     raise
 
-# Optional OpenAI usage (ChatGPT-like). Only used if OPENAI_API_KEY env var is set.
-USE_OPENAI = False
-if os.getenv("OPENAI_API_KEY"):
+# Optional OpenAI usage (ChatGPT-like). Only used if OPENAI_API_KEY env var is set;
+# the openai package itself is imported on the first chat request (see _get_openai).
+USE_OPENAI = bool(os.getenv("OPENAI_API_KEY"))
+_openai = None
+
+def _module_available(name):
+    """Cheap installed-check for optional packages; nothing is imported beyond parent packages."""
     try:
-        import openai
-        openai.api_key = os.getenv("OPENAI_API_KEY")
-        USE_OPENAI = True
+        return importlib.util.find_spec(name) is not None
     except Exception:
-        USE_OPENAI = False
+        # a missing parent package raises instead of returning None
+        return False
+
+# Optional Google Cloud streaming speech recognition. Only used if google-cloud-speech is installed;
+# otherwise listen_once falls back to SpeechRecognition's recognize_google.
+# The (grpc-heavy) package is imported on the first listen (see _get_speech_client).
+USE_STREAMING_STT = _module_available("google.cloud.speech")
+gspeech = None
+gapi_exceptions = None
+
+# Optional low-latency capture: sounddevice + webrtcvad replace sr.Microphone and its
+# noise calibration / heuristic endpointing when both are installed.
+# They are imported on the first listen (see _get_vad_libs); sounddevice loads PortAudio on import.
+USE_VAD_CAPTURE = _module_available("sounddevice") and _module_available("webrtcvad")
+_vad_libs = None
 
 # -------------------- Voice setup --------------------
+VOICE_CACHE_FILE = Path.home() / ".voicekit_voice"
+
+def _use_cached_voice(engine):
+    """Apply the voice id saved by a previous run; False if there is none or it no longer works."""
+    try:
+        voice_id = VOICE_CACHE_FILE.read_text().strip()
+    except Exception:
+        return False
+    if not voice_id:
+        return False
+    try:
+        # pyttsx3 reports driver errors via notify('error') instead of raising, so read the voice back
+        engine.setProperty("voice", voice_id)
+        if engine.getProperty("voice") == voice_id:
+            return True
+    except Exception:
+        pass
+    # stale or unknown id: forget it so the next run doesn't try it again
+    try:
+        VOICE_CACHE_FILE.unlink()
+    except Exception:
+        pass
+    return False
+
 def setup_voice_engine():
     try:
         engine = pyttsx3.init()
+        engine.setProperty("rate", 160)
+        # skip the (slow) voice enumeration when a previous run already picked one
+        if _use_cached_voice(engine):
+            return engine
         voices = engine.getProperty("voices")
         # attempt to pick a male voice; fallback to first voice
         male_voice = None
@@ -57,7 +109,12 @@ def setup_voice_engine():
             male_voice = voices[0]
         if male_voice:
             engine.setProperty("voice", male_voice.id)
-        engine.setProperty("rate", 160)
+            # cache whatever was applied (stock SAPI/espeak voices rarely say "male"); voices are only
+            # enumerated again when the cached id fails the read-back in _use_cached_voice
+            try:
+                VOICE_CACHE_FILE.write_text(male_voice.id)
+            except Exception as e:
+                print("Save voice choice failed:", e)
         return engine
     except Exception as e:
         print("Voice engine init failed:", e)
@@ -65,22 +122,29 @@ def setup_voice_engine():
 
 engine = setup_voice_engine()
 
+# one long-lived TTS worker; speak() only enqueues text
+_tts_q = queue.Queue()
+
+def _tts_worker():
+    while True:
+        text = _tts_q.get()
+        try:
+            engine.say(text)
+            engine.runAndWait()
+        except Exception as ee:
+            print("TTS error:", ee)
+        finally:
+            _tts_q.task_done()
+
+if engine is not None:
+    threading.Thread(target=_tts_worker, daemon=True).start()
+
 def speak(text):
     """Speak using pyttsx3 safely (non-blocking)."""
     if engine is None:
         print("TTS engine missing. Text:", text)
         return
-    try:
-        # run in a thread to avoid blocking (pyttsx3 is not fully async-friendly)
-        def _say():
-            try:
-                engine.say(text)
-                engine.runAndWait()
-            except Exception as ee:
-                print("TTS error:", ee)
-        threading.Thread(target=_say, daemon=True).start()
-    except Exception as e:
-        print("Speak error:", e)
+    _tts_q.put(text)
 
 # -------------------- Utilities --------------------
 def safe_open_url(url):
@@ -91,75 +155,159 @@ def safe_open_url(url):
         print("Open URL error:", e)
         speak("Sorry, I couldn't open the website.")
 
+# static per-process values used by open_app_by_name
+_IS_NT = os.name == "nt"
+_COMMON_COMMANDS = {
+    "notepad": "notepad" if _IS_NT else "gedit",
+    "calculator": "calc" if _IS_NT else "gnome-calculator",
+    "chrome": "start chrome" if _IS_NT else "google-chrome",
+    "firefox": "start firefox" if _IS_NT else "firefox",
+    "vscode": "code" if which("code") else None,
+    "explorer": "explorer" if _IS_NT else "nautilus",
+    "file explorer": "explorer" if _IS_NT else "nautilus",
+    "spotify": "start spotify" if _IS_NT else "spotify",
+}
+_PF_ROOTS = tuple(
+    p for p in (os.environ.get("ProgramFiles", r"C:\Program Files"),
+                os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)"))
+    if _IS_NT and p and os.path.exists(p)
+)
+
+# one reused launcher thread so Popen/cmd.exe startup never blocks the Tk mainloop
+_launcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="launcher")
+
+def _spawn(cmd, shell=False, name=None):
+    """Start cmd; when name is given, tell the user whether it opened."""
+    try:
+        subprocess.Popen(cmd, shell=shell)
+    except Exception as e:
+        print("Launch failed:", e)
+        if name:
+            speak(f"Failed to open {name}.")
+        return
+    if name:
+        speak(f"Opening {name}")
+
+# Program Files .exe index (Windows): stem -> path, persisted and refreshed after EXE_INDEX_TTL,
+# or sooner when a lookup misses (newly installed apps)
+EXE_INDEX_FILE = Path.home() / ".voicekit_exeindex.json"
+EXE_INDEX_TTL = 24 * 60 * 60  # seconds
+EXE_INDEX_MISS_TTL = 5 * 60  # seconds; an index at least this old is rebuilt after a miss
+_exe_index = None
+_exe_index_ts = 0.0
+_exe_index_thread = None
+_exe_index_lock = threading.Lock()
+
+def _walk_exes(root):
+    """Yield (stem_lower, path) for every .exe under root; iterative os.scandir DFS without Path objects."""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name[-4:].lower() == ".exe":
+                            yield entry.name[:-4].lower(), entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+def _scan_exes(root, found):
+    for stem, path in _walk_exes(root):
+        found.setdefault(stem, path)
+
+def _build_exe_index():
+    global _exe_index, _exe_index_ts
+    found = {}
+    for root in _PF_ROOTS:
+        _scan_exes(root, found)
+    ts = time.time()
+    try:
+        EXE_INDEX_FILE.write_text(json.dumps({"ts": ts, "map": found}))
+    except Exception as e:
+        print("Save exe index failed:", e)
+    with _exe_index_lock:
+        _exe_index, _exe_index_ts = found, ts
+
+def _get_exe_index():
+    """
+    Return the cached exe map (possibly stale), or None while the first build is still running.
+    Starts a background rebuild when the index is missing or older than EXE_INDEX_TTL.
+    """
+    global _exe_index, _exe_index_ts
+    with _exe_index_lock:
+        if _exe_index is None and EXE_INDEX_FILE.exists():
+            try:
+                data = json.loads(EXE_INDEX_FILE.read_text())
+                _exe_index, _exe_index_ts = data["map"], float(data["ts"])
+            except Exception:
+                pass
+        if _exe_index is None or time.time() - _exe_index_ts > EXE_INDEX_TTL:
+            _start_exe_index_build()
+        return _exe_index
+
+def _exe_index_missed():
+    """A lookup missed: rebuild in the background, at most once per EXE_INDEX_MISS_TTL."""
+    with _exe_index_lock:
+        if time.time() - _exe_index_ts > EXE_INDEX_MISS_TTL:
+            _start_exe_index_build()
+
+def _start_exe_index_build():
+    # caller holds _exe_index_lock
+    global _exe_index_thread
+    if _exe_index_thread is None or not _exe_index_thread.is_alive():
+        _exe_index_thread = threading.Thread(target=_build_exe_index, daemon=True)
+        _exe_index_thread.start()
+
 def open_app_by_name(name, app_map):
     """
     Try to open app by known mapping or by common commands.
     app_map is a dict of lower-name -> command / exe path
+
+    Launches run on the background launcher, so True means a launch was started, not that it succeeded:
+    _spawn announces "Opening ..." or "Failed to open ..." itself, and a failed launch does not fall
+    through to the later lookups.
     """
     lname = name.lower().strip()
     # direct mapping from user-configured map
     if lname in app_map:
         cmd = app_map[lname]
-        try:
-            if os.name == "nt":
-                # Windows: start file or exe
-                subprocess.Popen(cmd, shell=True)
-            else:
-                subprocess.Popen(cmd.split(), shell=False)
-            speak(f"Opening {name}")
-            return True
-        except Exception as e:
-            print("Open mapped app failed:", e)
-            speak(f"Failed to open {name}.")
-            return False
+        if _IS_NT:
+            # Windows: start file or exe
+            _launcher.submit(_spawn, cmd, True, name)
+        else:
+            _launcher.submit(_spawn, cmd.split(), False, name)
+        return True
 
     # try built-in shortcuts for common apps
-    common_commands = {
-        "notepad": "notepad" if os.name == "nt" else "gedit",
-        "calculator": "calc" if os.name == "nt" else "gnome-calculator",
-        "chrome": "start chrome" if os.name == "nt" else "google-chrome",
-        "firefox": "start firefox" if os.name == "nt" else "firefox",
-        "vscode": "code" if which("code") else None,
-        "explorer": "explorer" if os.name == "nt" else "nautilus",
-        "file explorer": "explorer" if os.name == "nt" else "nautilus",
-        "spotify": "start spotify" if os.name == "nt" else "spotify",
-    }
-    if lname in common_commands and common_commands[lname]:
-        cmd = common_commands[lname]
-        try:
-            subprocess.Popen(cmd, shell=True)
-            speak(f"Opening {name}")
-            return True
-        except Exception as e:
-            print("Open common app failed:", e)
+    if _COMMON_COMMANDS.get(lname):
+        cmd = _COMMON_COMMANDS[lname]
+        # Windows needs cmd.exe here: "start ..." is a shell builtin, and "code" resolves to code.cmd via PATHEXT
+        if _IS_NT:
+            _launcher.submit(_spawn, cmd, True, name)
+        else:
+            _launcher.submit(_spawn, cmd.split(), False, name)
+        return True
 
     # search PATH for executable with the name
     if which(lname):
-        try:
-            subprocess.Popen([lname])
-            speak(f"Opening {name}")
-            return True
-        except Exception as e:
-            print("Open PATH app failed:", e)
+        _launcher.submit(_spawn, [lname], False, name)
+        return True
 
     # fallback: try to find .exe in Program Files (Windows)
-    if os.name == "nt":
-        possible = []
-        pf = os.environ.get("ProgramFiles", r"C:\Program Files")
-        pf86 = os.environ.get("ProgramFiles(x86)", r"C:\Program Files (x86)")
-        for root in (pf, pf86):
-            if root and os.path.exists(root):
-                for p in Path(root).rglob("*.exe"):
-                    if p.stem.lower() == lname:
-                        possible.append(str(p))
-                        break
-        if possible:
-            try:
-                subprocess.Popen(possible[0], shell=True)
-                speak(f"Opening {name}")
-                return True
-            except Exception as e:
-                print("Open exe found failed:", e)
+    if _IS_NT:
+        index = _get_exe_index()
+        if index is None:
+            # the first index build is still running in the background; don't walk the trees a second time here
+            speak(f"I'm still indexing your installed apps. Try opening {name} again shortly.")
+            return False
+        if lname in index:
+            _launcher.submit(_spawn, [index[lname]], False, name)
+            return True
+        _exe_index_missed()
 
     speak(f"Sorry, I can't find an app called {name}. You can add it from the UI.")
     return False
@@ -167,16 +315,174 @@ def open_app_by_name(name, app_map):
 # -------------------- Speech Listening --------------------
 recognizer = sr.Recognizer()
 
+# ambient noise calibration is done once; the recognizer keeps its energy_threshold afterwards
+_calibrated = False
+
+def calibration_applies():
+    """Calibration only exists on the plain sr.Microphone + recognize_google path."""
+    return not USE_STREAMING_STT and not USE_VAD_CAPTURE
+
+def reset_calibration():
+    """Make the next listen_once recalibrate for ambient noise."""
+    global _calibrated
+    _calibrated = False
+
+STREAM_RATE = 16000
+STREAM_CHUNK = STREAM_RATE // 10  # 100 ms of LINEAR16 audio per request
+_speech_client = None
+
+def _get_speech_client():
+    """Import Cloud Speech and create the client once; disable streaming if that fails (e.g. no credentials)."""
+    global _speech_client, USE_STREAMING_STT, gspeech, gapi_exceptions
+    if _speech_client is None and USE_STREAMING_STT:
+        try:
+            from google.cloud import speech as gspeech
+            from google.api_core import exceptions as gapi_exceptions
+            _speech_client = gspeech.SpeechClient()
+        except Exception as e:
+            print("Streaming STT unavailable, using recognize_google:", e)
+            USE_STREAMING_STT = False
+    return _speech_client if USE_STREAMING_STT else None
+
+VAD_FRAME = STREAM_RATE // 50  # 20 ms frames for webrtcvad
+VAD_CHUNK_FRAMES = STREAM_CHUNK // VAD_FRAME  # frames per 100 ms chunk handed to the recognizer
+VAD_PREROLL_FRAMES = 10  # 200 ms kept from before speech starts so the first word isn't clipped
+VAD_END_FRAMES = 40  # 800 ms of silence ends the utterance
+
+def _get_vad_libs():
+    """Import sounddevice and webrtcvad once; disable VAD capture if that fails (e.g. no PortAudio)."""
+    global _vad_libs, USE_VAD_CAPTURE
+    if _vad_libs is None and USE_VAD_CAPTURE:
+        try:
+            import sounddevice
+            import webrtcvad
+            _vad_libs = (sounddevice, webrtcvad)
+        except Exception as e:
+            print("VAD capture unavailable, using sr.Microphone:", e)
+            USE_VAD_CAPTURE = False
+    return _vad_libs if USE_VAD_CAPTURE else None
+
+def _mic_chunks(done, timeout, phrase_time_limit):
+    """Yield 100 ms LINEAR16 chunks from sr.Microphone until done is set or the time limit passes."""
+    # the microphone is opened and closed here, on the thread that reads it
+    with sr.Microphone(sample_rate=STREAM_RATE, chunk_size=STREAM_CHUNK) as source:
+        deadline = time.monotonic() + timeout + phrase_time_limit
+        while not done.is_set() and time.monotonic() < deadline:
+            yield source.stream.read(STREAM_CHUNK)
+
+def _vad_chunks(done, timeout, phrase_time_limit):
+    """
+    Yield 100 ms LINEAR16 chunks of one utterance captured with sounddevice.
+    webrtcvad decides where speech starts and ends; nothing is yielded if no speech starts within timeout.
+    """
+    sd, webrtcvad = _get_vad_libs()
+    frames = queue.Queue()
+    vad = webrtcvad.Vad(2)
+    preroll = collections.deque(maxlen=VAD_PREROLL_FRAMES)
+    state = {"voiced": False, "silent": 0}
+
+    def callback(indata, frame_count, time_info, status):
+        frame = bytes(indata)
+        speech = vad.is_speech(frame, STREAM_RATE)
+        if not state["voiced"]:
+            if not speech:
+                preroll.append(frame)
+                return
+            state["voiced"] = True
+            for f in preroll:
+                frames.put(f)
+        frames.put(frame)
+        state["silent"] = 0 if speech else state["silent"] + 1
+        if state["silent"] >= VAD_END_FRAMES:
+            frames.put(None)
+            raise sd.CallbackStop
+
+    with sd.RawInputStream(samplerate=STREAM_RATE, blocksize=VAD_FRAME, dtype="int16",
+                           channels=1, callback=callback):
+        start = time.monotonic()
+        buf = []
+        while not done.is_set():
+            elapsed = time.monotonic() - start
+            if not state["voiced"] and elapsed > timeout:
+                return
+            if elapsed > timeout + phrase_time_limit:
+                break
+            try:
+                frame = frames.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if frame is None:
+                break
+            buf.append(frame)
+            if len(buf) >= VAD_CHUNK_FRAMES:
+                yield b"".join(buf)
+                buf = []
+        if buf:
+            yield b"".join(buf)
+
+def _listen_streaming(client, chunks, done):
+    """
+    Stream audio chunks to Google Cloud Speech while the user talks.
+    Returns the first final transcript or None; sets done so the capture generator stops.
+    A failing RPC (e.g. the Speech API isn't enabled) switches later listens to recognize_google.
+    """
+    global USE_STREAMING_STT
+    streaming_config = gspeech.StreamingRecognitionConfig(
+        config=gspeech.RecognitionConfig(
+            encoding=gspeech.RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=STREAM_RATE,
+            language_code="en-US",
+        ),
+        interim_results=True,
+        single_utterance=True,
+    )
+    try:
+        audio_requests = (gspeech.StreamingRecognizeRequest(audio_content=chunk) for chunk in chunks)
+        responses = client.streaming_recognize(config=streaming_config, requests=audio_requests)
+        for response in responses:
+            for result in response.results:
+                if not result.alternatives:
+                    continue
+                if result.is_final:
+                    return result.alternatives[0].transcript
+                print("Interim:", result.alternatives[0].transcript)
+    except gapi_exceptions.GoogleAPICallError as e:
+        print("Streaming STT failed, using recognize_google from now on:", e)
+        USE_STREAMING_STT = False
+    finally:
+        done.set()
+    return None
+
 def listen_once(timeout=6, phrase_time_limit=8):
     """
     Returns recognized text or None.
-    Uses Google Web Speech API (requires internet).
+    Streams to Google Cloud Speech when available, otherwise uses Google Web Speech API (requires internet).
+    Audio comes from sounddevice + webrtcvad when installed, otherwise from sr.Microphone.
     """
+    global _calibrated
     try:
-        with sr.Microphone() as source:
-            recognizer.adjust_for_ambient_noise(source, duration=0.6)
-            audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
-        text = recognizer.recognize_google(audio)
+        client = _get_speech_client()
+        vad_libs = _get_vad_libs()
+        if client is not None or vad_libs is not None:
+            done = threading.Event()
+            capture = _vad_chunks if vad_libs is not None else _mic_chunks
+            chunks = capture(done, timeout, phrase_time_limit)
+            if client is not None:
+                text = _listen_streaming(client, chunks, done)
+            else:
+                audio = b"".join(chunks)
+                text = recognizer.recognize_google(sr.AudioData(audio, STREAM_RATE, 2)) if audio else None
+            if not text:
+                print("Could not understand audio.")
+                return None
+        else:
+            with sr.Microphone() as source:
+                if not _calibrated:
+                    recognizer.adjust_for_ambient_noise(source, duration=0.6)
+                    _calibrated = True
+                    print("Calibrated energy threshold:", recognizer.energy_threshold)
+                audio = recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+            text = recognizer.recognize_google(audio)
         print("Recognized:", text)
         return text
     except sr.WaitTimeoutError:
@@ -192,24 +498,77 @@ def listen_once(timeout=6, phrase_time_limit=8):
         print("General listen error:", e)
         return None
 
+# -------------------- Wikipedia --------------------
+WIKI_TTL = 60 * 60  # seconds
+
+@functools.lru_cache(maxsize=256)
+def _wiki_summary(topic, _ttl_bucket):
+    # _ttl_bucket changes every WIKI_TTL seconds, so cached summaries expire with it; errors are not cached
+    return wikipedia.summary(topic, sentences=2)
+
+def wiki_summary(topic):
+    """Two-sentence Wikipedia summary, cached per topic for up to WIKI_TTL seconds."""
+    return _wiki_summary(topic, int(time.time() // WIKI_TTL))
+
 # -------------------- AI chat (light) --------------------
-def ai_chat_local(prompt):
+def _get_openai():
+    """Import and configure openai once; disable OpenAI chat if it can't be imported."""
+    global _openai, USE_OPENAI
+    if _openai is None and USE_OPENAI:
+        try:
+            import openai
+            openai.api_key = os.getenv("OPENAI_API_KEY")
+            _openai = openai
+        except Exception as e:
+            print("OpenAI unavailable, using local chat:", e)
+            USE_OPENAI = False
+    return _openai
+
+# a sentence ends at . ! or ? followed by whitespace (so "3.14" stays whole), or at a newline
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)|\n")
+
+def ai_chat_local(prompt, on_sentence=None):
     """
-    Small rule-based fallback chat. If USE_OPENAI True, call OpenAI API instead.
+    Small rule-based fallback chat. If USE_OPENAI is True, stream from the OpenAI API instead
+    and pass each finished sentence to on_sentence as soon as it arrives.
     """
-    if USE_OPENAI:
+    client = _get_openai()
+    if client is not None:
+        parts = []
         try:
-            # simple completion call (you can tune model and params)
-            resp = openai.Completion.create(
-                model="text-davinci-003",
-                prompt=prompt,
+            stream = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
                 max_tokens=150,
                 temperature=0.6,
+                stream=True,
             )
-            return resp.choices[0].text.strip()
+            pending = ""
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    # e.g. the leading role-only chunk
+                    continue
+                parts.append(delta)
+                pending += delta
+                while True:
+                    m = _SENTENCE_END_RE.search(pending)
+                    if not m:
+                        break
+                    sentence, pending = pending[:m.end()].strip(), pending[m.end():]
+                    if sentence and on_sentence:
+                        on_sentence(sentence)
+            if pending.strip() and on_sentence:
+                on_sentence(pending.strip())
+            return "".join(parts).strip()
         except Exception as e:
             print("OpenAI error:", e)
-            # fall back to local
+            # keep a partial answer; otherwise fall back to local
+            partial = "".join(parts).strip()
+            if partial:
+                return partial
     # Local simple responses
     lp = prompt.lower()
     if "how are you" in lp:
@@ -224,27 +583,65 @@ def ai_chat_local(prompt):
 
 # -------------------- Persisted app mappings --------------------
 APP_MAP_FILE = Path.home() / ".voicekit_appmap.json"
+# new mappings are appended here and folded into APP_MAP_FILE on load
+APP_MAP_JOURNAL = APP_MAP_FILE.with_suffix(".jsonl")
+APP_MAP_COMPACT_AFTER = 50  # journal entries
 
 def load_app_map():
+    mapping = {}
     if APP_MAP_FILE.exists():
         try:
-            return json.loads(APP_MAP_FILE.read_text())
+            mapping = json.loads(APP_MAP_FILE.read_text())
         except Exception:
-            return {}
-    return {}
+            mapping = {}
+    if APP_MAP_JOURNAL.exists():
+        entries = 0
+        try:
+            with open(APP_MAP_JOURNAL, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        mapping[entry["name"]] = entry["cmd"]
+                        entries += 1
+                    except Exception:
+                        continue  # e.g. a torn last line
+        except Exception as e:
+            print("Read app map journal failed:", e)
+        if entries >= APP_MAP_COMPACT_AFTER:
+            save_app_map(mapping)
+    return mapping
 
-def save_app_map(mapping):
+def save_app_map(mapping, delta=None):
+    """
+    Persist app mappings. With delta=(name, cmd) only that entry is appended to the journal;
+    without it the whole mapping is written to APP_MAP_FILE and the journal is cleared.
+    """
     try:
+        if delta is not None:
+            name, cmd = delta
+            with open(APP_MAP_JOURNAL, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"name": name, "cmd": cmd}) + "\n")
+            return
         APP_MAP_FILE.write_text(json.dumps(mapping, indent=2))
+        if APP_MAP_JOURNAL.exists():
+            APP_MAP_JOURNAL.unlink()
     except Exception as e:
         print("Save app map failed:", e)
 
 # -------------------- GUI --------------------
+WAVE_LANES = 14
+WAVE_STEPS = 25  # the wave advances 0.12 per frame with period 3, so it repeats every 25 frames
+WAVE_BAR_LEN = 60  # longer than the tallest wave height (57.5)
+
+# "<verb> <arg>" commands; "play music" needs no argument, the other verbs must be followed by whitespace
+_CMD_RE = re.compile(r"^(?P<verb>play music|(?:open|search|wikipedia|chat|talk)(?=\s))\s*(?P<arg>.*)$",
+                     re.I | re.S)
+
 class VoiceKitApp:
     def __init__(self, root):
         self.root = root
         self.root.title("VoiceKit Assistant")
-        self.root.geometry("520x620")
+        self.root.geometry("520x660")
         self.root.configure(bg="#0f0f11")
         self.app_map = load_app_map()
 
@@ -257,7 +654,14 @@ class VoiceKitApp:
         self.canvas.pack(pady=6)
         self.circle = self.canvas.create_oval(90, 90, 210, 210, fill="#3aa0ff", outline="")
         # waveform lines
-        self.waves = [self.canvas.create_line(40+i*12, 260, 40+i*12, 260, fill="#7be1ff", width=3) for i in range(14)]
+        # each bar is a fixed-length line hanging below the baseline; a background strip hides the part
+        # under y=260, so a frame only has to move bars up or down instead of rewriting their coords
+        self._wave_x = tuple(40 + i * 12 for i in range(WAVE_LANES))
+        self.waves = [self.canvas.create_line(x, 260, x, 260 + WAVE_BAR_LEN, fill="#7be1ff", width=3)
+                      for x in self._wave_x]
+        self.canvas.create_rectangle(0, 260, 300, 300, fill="#0f0f11", outline="")
+        self._wave_top = [260.0] * WAVE_LANES
+        self._wave_table = self._build_wave_table()
 
         # Buttons row
         btn_frame = tk.Frame(root, bg="#0f0f11")
@@ -274,6 +678,11 @@ class VoiceKitApp:
                                      bg="#ffa726", fg="white", font=("Segoe UI", 11), padx=12, pady=8, bd=0)
         self.add_app_btn.grid(row=0, column=2, padx=8)
 
+        self.recal_btn = tk.Button(btn_frame, text="🔄 Recalibrate Mic", command=self.recalibrate_mic,
+                                   bg="#455a64", fg="white", font=("Segoe UI", 10), padx=8, pady=4, bd=0)
+        self.recal_btn.grid(row=1, column=0, columnspan=3, pady=(8, 0))
+        self._sync_recal_btn()
+
         # Text entry for typed commands
         self.entry = tk.Entry(root, font=("Segoe UI", 12), width=44, bg="#1b1b1b", fg="white", insertbackground="white")
         self.entry.pack(pady=8)
@@ -283,59 +692,122 @@ class VoiceKitApp:
         self.output.pack(padx=12, pady=10, fill="x")
         self.output.insert("end", "Say commands like: 'open chrome', 'wikipedia alan turing', 'search python list', 'play music', 'chat how are you'\n")
         self.output.configure(state="disabled")
+        # pending log lines, flushed together by _flush_log
+        self._log_buf = []
+        self._log_flush_pending = False
+        self._log_lock = threading.Lock()
+        self._last_ts_sec = None
+        self._last_ts_str = ""
 
         # Status
         self.status_var = tk.StringVar(value="Ready")
         tk.Label(root, textvariable=self.status_var, bg="#0f0f11", fg="#9fd3ff", font=("Segoe UI", 10)).pack(pady=6)
 
-        # animation control
+        # shared workers for network calls (Wikipedia, AI chat); voice capture has its own thread.
+        # Unlike the daemon threads they replace, these are joined at exit (see on_close).
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="voicekit")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # command verb -> handler, matched by _CMD_RE in handle_command_text
+        self._handlers = {
+            "open": self._do_open,
+            "search": self._do_search,
+            "wikipedia": self._do_wikipedia,
+            "play music": self._do_play_music,
+            "chat": self._do_chat,
+            "talk": self._do_chat,
+        }
+
+        # animation control (driven by root.after on the Tk mainloop)
         self.animating = False
+        self._anim_job = None
+        self._anim_grow = True
+        self._anim_frame = 0
+        self._anim_width = 120.0
 
     # ---------------- Animation ----------------
+    def _build_wave_table(self):
+        """Top y of every wave line for each frame, flattened as [frame * WAVE_LANES + lane]."""
+        table = array.array("f")
+        for frame in range(WAVE_STEPS):
+            t = frame * 0.12
+            for i in range(WAVE_LANES):
+                h = 20 + (1 + (0.5 + 0.5 * (1 + (0.5 * (i%3)))) ) * (10 * abs((i * 0.3 + t) % 3 - 1.5))
+                table.append(260 - h)
+        return table
+
     def start_animation(self):
         if self.animating:
             return
         self.animating = True
-        threading.Thread(target=self._animate_loop, daemon=True).start()
+        self._anim_grow = True
+        self._anim_frame = 0
+        # the tracked width must match the oval, so reset both together
+        self.canvas.coords(self.circle, 90, 90, 210, 210)
+        self._anim_width = 120.0
+        # a tick may still be pending from a quick stop/start; it will simply keep going
+        if self._anim_job is None:
+            self._anim_job = self.root.after(0, self._animate_tick)
 
     def stop_animation(self):
         self.animating = False
 
-    def _animate_loop(self):
-        grow = True
-        t = 0.0
-        while self.animating:
-            try:
-                # pulse circle
-                coords = self.canvas.coords(self.circle)
-                cx = (coords[0] + coords[2]) / 2
-                cy = (coords[1] + coords[3]) / 2
-                factor = 1.01 if grow else 0.99
-                self.canvas.scale(self.circle, cx, cy, factor, factor)
-
-                # waveform simulation
-                for i, line_id in enumerate(self.waves):
-                    h = 20 + (1 + (0.5 + 0.5 * (1 + (0.5 * (i%3)))) ) * (10 * abs((i * 0.3 + t) % 3 - 1.5))
-                    x = 40 + i * 12
-                    self.canvas.coords(line_id, x, 260 - h, x, 260)
-                t += 0.12
-
-                # flip grow when too large/small
-                coords = self.canvas.coords(self.circle)
-                width = coords[2] - coords[0]
-                if width > 150:
-                    grow = False
-                elif width < 100:
-                    grow = True
-
-                time.sleep(0.04)
-            except Exception:
-                break
+    def _animate_tick(self):
+        """One animation frame, run on the Tk mainloop; reschedules itself while animating."""
+        self._anim_job = None
+        if not self.animating:
+            # reset the circle once the loop winds down
+            self.canvas.coords(self.circle, 90, 90, 210, 210)
+            return
+        try:
+            # pulse circle around its fixed centre; width is tracked instead of read back
+            factor = 1.01 if self._anim_grow else 0.99
+            self.canvas.scale(self.circle, 150, 150, factor, factor)
+            self._anim_width *= factor
+
+            # waveform from the precomputed table
+            table = self._wave_table
+            base = (self._anim_frame % WAVE_STEPS) * WAVE_LANES
+            tops = self._wave_top
+            for i, line_id in enumerate(self.waves):
+                top = table[base + i]
+                dy = top - tops[i]
+                if dy:
+                    self.canvas.move(line_id, 0, dy)
+                    tops[i] = top
+            self._anim_frame += 1
+
+            # flip grow when too large/small
+            if self._anim_width > 150:
+                self._anim_grow = False
+            elif self._anim_width < 100:
+                self._anim_grow = True
+        except Exception:
+            self.animating = False
+            return
+        self._anim_job = self.root.after(40, self._animate_tick)
 
     # ---------------- UI helpers ----------------
     def log(self, text):
+        """Queue a log line; lines are written to the output box once per idle cycle."""
+        sec = int(time.time())
+        with self._log_lock:
+            # strftime only once per second; bursts of log lines reuse the cached stamp
+            if sec != self._last_ts_sec:
+                self._last_ts_str = time.strftime("%H:%M:%S", time.localtime(sec))
+                self._last_ts_sec = sec
+            self._log_buf.append(f"[{self._last_ts_str}] {text}\n")
+            if self._log_flush_pending:
+                return
+            self._log_flush_pending = True
+        self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        with self._log_lock:
+            lines, self._log_buf = self._log_buf, []
+            self._log_flush_pending = False
         self.output.configure(state="normal")
-        self.output.insert("end", f"[{datetime.now().strftime('%H:%M:%S')}] {text}\n")
+        self.output.insert("end", "".join(lines))
         self.output.see("end")
         self.output.configure(state="disabled")
 
@@ -352,57 +824,59 @@ class VoiceKitApp:
         self.log("Command: " + command)
         cmd = command.lower()
 
-        # simple patterns
-        if cmd.startswith("open "):
-            app_name = cmd.replace("open ", "", 1).strip()
-            self.set_status("Opening app: " + app_name)
-            open_app_by_name(app_name, self.app_map)
-            return
-
-        if cmd.startswith("search "):
-            topic = command.replace("search ", "", 1).strip()
-            self.set_status("Searching web: " + topic)
-            safe_open_url(f"https://www.google.com/search?q={webbrowser.quote(topic) if hasattr(webbrowser, 'quote') else topic}")
-            return
+        m = _CMD_RE.match(command)
+        verb = m["verb"].lower() if m else None
 
-        if cmd.startswith("wikipedia "):
-            topic = command.replace("wikipedia ", "", 1).strip()
-            self.set_status("Searching Wikipedia: " + topic)
-            threading.Thread(target=self._wikipedia_search, args=(topic,), daemon=True).start()
-            return
-
-        if cmd.startswith("play music"):
-            # open Music folder
-            music_dir = os.path.expanduser("~/Music")
-            if os.path.exists(music_dir):
-                try:
-                    os.startfile(music_dir) if os.name == "nt" else subprocess.Popen(["xdg-open", music_dir])
-                    speak("Opening your Music folder")
-                except Exception as e:
-                    print("Play music error:", e)
-                    speak("Couldn't open the music folder.")
-            else:
-                speak("Music folder not found.")
-            return
-
-        if "time" in cmd and len(cmd.split()) <= 3:
+        # short questions mentioning the time win over chat, but not over the other commands
+        if verb in (None, "chat", "talk") and "time" in cmd and len(cmd.split()) <= 3:
             speak(f"The time is {datetime.now().strftime('%I:%M %p')}")
             return
 
-        if cmd.startswith("chat ") or cmd.startswith("talk "):
-            prompt = command.split(" ", 1)[1] if " " in command else ""
-            self.set_status("Chatting...")
-            threading.Thread(target=self._chat_with_ai, args=(prompt,), daemon=True).start()
+        if verb:
+            self._handlers[verb](m["arg"].strip())
             return
 
         # fallback: try ai chat
         self.set_status("Thinking...")
-        threading.Thread(target=self._chat_with_ai, args=(command,), daemon=True).start()
+        self._pool.submit(self._chat_with_ai, command)
+
+    def _do_open(self, arg):
+        app_name = arg.lower()
+        self.set_status("Opening app: " + app_name)
+        open_app_by_name(app_name, self.app_map)
+
+    def _do_search(self, topic):
+        self.set_status("Searching web: " + topic)
+        safe_open_url(f"https://www.google.com/search?q={quote_plus(topic)}")
+
+    def _do_wikipedia(self, topic):
+        self.set_status("Searching Wikipedia: " + topic)
+        self._pool.submit(self._wikipedia_search, topic)
+
+    def _do_play_music(self, _arg):
+        # open Music folder
+        music_dir = os.path.expanduser("~/Music")
+        if os.path.exists(music_dir):
+            try:
+                if os.name == "nt":
+                    os.startfile(music_dir)
+                else:
+                    _launcher.submit(_spawn, ["xdg-open", music_dir])
+                speak("Opening your Music folder")
+            except Exception as e:
+                print("Play music error:", e)
+                speak("Couldn't open the music folder.")
+        else:
+            speak("Music folder not found.")
+
+    def _do_chat(self, prompt):
+        self.set_status("Chatting...")
+        self._pool.submit(self._chat_with_ai, prompt)
 
     def _wikipedia_search(self, topic):
         try:
             self.log("Wikipedia search for: " + topic)
-            summary = wikipedia.summary(topic, sentences=2)
+            summary = wiki_summary(topic)
             self.log("Wikipedia: " + summary)
             speak(summary)
         except Exception as e:
@@ -414,9 +888,17 @@ class VoiceKitApp:
     def _chat_with_ai(self, prompt):
         try:
             self.log("AI prompt: " + prompt)
-            answer = ai_chat_local(prompt)
+            spoken = []
+
+            def say_sentence(sentence):
+                spoken.append(sentence)
+                speak(sentence)
+
+            answer = ai_chat_local(prompt, on_sentence=say_sentence)
             self.log("AI answer: " + answer)
-            speak(answer)
+            # streamed answers are already queued for speech sentence by sentence
+            if not spoken:
+                speak(answer)
         except Exception as e:
             print("AI chat error:", e)
             speak("I couldn't complete the chat request.")
@@ -429,13 +911,15 @@ class VoiceKitApp:
         self.set_status("Listening...")
         self.log("Listening (voice)...")
         self.start_animation()
+        # not on self._pool: the mic must open right away, not queue behind network calls
         threading.Thread(target=self._do_voice_listen, daemon=True).start()
 
     def _do_voice_listen(self):
         try:
             txt = listen_once()
             self.stop_animation()
-            self.canvas.coords(self.circle, 90, 90, 210, 210)
+            # streaming STT may have been switched off during this listen
+            self.root.after(0, self._sync_recal_btn)
             if txt:
                 self.entry.delete(0, "end")
                 self.entry.insert(0, txt)
@@ -450,6 +934,13 @@ class VoiceKitApp:
             self.set_status("Ready")
             self.stop_animation()
 
+    def _sync_recal_btn(self):
+        self.recal_btn.configure(state="normal" if calibration_applies() else "disabled")
+
+    def recalibrate_mic(self):
+        reset_calibration()
+        self.log("Microphone will recalibrate for background noise on the next listen.")
+
     def type_and_send(self):
         text = self.entry.get().strip()
         if not text:
@@ -466,11 +957,18 @@ class VoiceKitApp:
         if not path:
             return
         # store mapping (use quoted path if spaces)
-        self.app_map[name.lower().strip()] = f'"{path}"' if " " in path else path
-        save_app_map(self.app_map)
+        key = name.lower().strip()
+        self.app_map[key] = f'"{path}"' if " " in path else path
+        save_app_map(self.app_map, delta=(key, self.app_map[key]))
         speak(f"Saved mapping for {name}")
         self.log(f"Added app mapping: {name} -> {path}")
 
+    def on_close(self):
+        # drop queued network work. A Wikipedia/OpenAI call that is already running can't be cancelled and,
+        # since pool workers are joined at interpreter exit, the process ends only once it returns.
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
 # -------------------- Main --------------------
 def main():
     root = tk.Tk()